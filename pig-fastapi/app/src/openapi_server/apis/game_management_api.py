@@ -1,11 +1,9 @@
 # coding: utf-8
 
-from typing import Dict, List  # noqa: F401
-import importlib
-import pkgutil
+from typing import Dict, List, Optional  # noqa: F401
 
 from openapi_server.apis.game_management_api_base import BaseGameManagementApi
-import openapi_server.impl
+from openapi_server.impl import pig_game_impl  # noqa: F401
 
 from fastapi import (  # noqa: F401
     APIRouter,
@@ -22,6 +20,8 @@ from fastapi import (  # noqa: F401
     status,
 )
 
+from fastapi.responses import ORJSONResponse
+
 from openapi_server.models.extra_models import TokenModel  # noqa: F401
 from pydantic import Field
 from typing_extensions import Annotated
@@ -33,9 +33,20 @@ from openapi_server.models.new_game_response import NewGameResponse
 
 router = APIRouter()
 
-ns_pkg = openapi_server.impl
-for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
-    importlib.import_module(name)
+
+def _opaque_tag(tag: str) -> str:
+    """Strips the weak indicator from an entity tag"""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Checks an If-None-Match header value against an ETag using the weak
+    comparison RFC 9110 requires ("*" matches any current representation).
+    """
+    tags = [_opaque_tag(tag) for tag in if_none_match.split(",")]
+    return "*" in tags or _opaque_tag(etag) in tags
 
 
 @router.post(
@@ -46,29 +57,42 @@ for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
     },
     tags=["Game Management"],
     summary="Start a new Pig game.",
+    response_model=NewGameResponse,
     response_model_by_alias=True,
 )
 async def create_new_game(
-) -> NewGameResponse:
-    if not BaseGameManagementApi.subclasses:
+) -> Response:
+    if BaseGameManagementApi._impl is None:
         raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseGameManagementApi.subclasses[0]().create_new_game()
+    result = BaseGameManagementApi._impl.create_new_game()
+    return ORJSONResponse(result.model_dump(mode="json"))
 
 
 @router.get(
     "/game/{game_id}",
     responses={
         200: {"model": GameState, "description": "Current game state."},
+        304: {"description": "Game state unchanged since the If-None-Match ETag."},
         404: {"model": ErrorResponse, "description": "Game not found."},
         500: {"model": ErrorResponse, "description": "Internal server error."},
     },
     tags=["Game Management"],
     summary="Get the current state of a specific game.",
+    response_model=GameState,
     response_model_by_alias=True,
 )
 async def get_game_state(
     game_id: Annotated[UUID, Field(description="The unique identifier of the game.")] = Path(..., description="The unique identifier of the game."),
-) -> GameState:
-    if not BaseGameManagementApi.subclasses:
+    if_none_match: Optional[str] = Header(
+        None, description="ETag of a previously fetched game state."
+    ),
+) -> Response:
+    if BaseGameManagementApi._impl is None:
         raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseGameManagementApi.subclasses[0]().get_game_state(game_id)
+    content, version = BaseGameManagementApi._impl.get_game_state_json(game_id)
+    etag = f'W/"{version}"'
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=content, media_type="application/json", headers={"ETag": etag}
+    )
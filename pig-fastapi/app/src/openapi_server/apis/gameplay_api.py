@@ -1,11 +1,9 @@
 # coding: utf-8
 
 from typing import Dict, List  # noqa: F401
-import importlib
-import pkgutil
 
 from openapi_server.apis.gameplay_api_base import BaseGameplayApi
-import openapi_server.impl
+from openapi_server.impl import pig_game_impl  # noqa: F401
 
 from fastapi import (  # noqa: F401
     APIRouter,
@@ -32,10 +30,6 @@ from openapi_server.models.game_state import GameState
 
 router = APIRouter()
 
-ns_pkg = openapi_server.impl
-for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
-    importlib.import_module(name)
-
 
 @router.post(
     "/game/{game_id}/roll",
@@ -47,14 +41,16 @@ for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
     },
     tags=["Gameplay"],
     summary="Roll the die for the current player.",
+    response_model=GameState,
     response_model_by_alias=True,
 )
 async def roll_die(
     game_id: Annotated[UUID, Field(description="The unique identifier of the game.")] = Path(..., description="The unique identifier of the game."),
-) -> GameState:
-    if not BaseGameplayApi.subclasses:
+) -> Response:
+    if BaseGameplayApi._impl is None:
         raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseGameplayApi.subclasses[0]().roll_die(game_id)
+    content = BaseGameplayApi._impl.roll_die(game_id)
+    return Response(content=content, media_type="application/json")
 
 
 @router.post(
@@ -67,11 +63,13 @@ async def roll_die(
     },
     tags=["Gameplay"],
     summary="Current player holds, ending their turn and adding turn total to score.",
+    response_model=GameState,
     response_model_by_alias=True,
 )
 async def hold_turn(
     game_id: Annotated[UUID, Field(description="The unique identifier of the game.")] = Path(..., description="The unique identifier of the game."),
-) -> GameState:
-    if not BaseGameplayApi.subclasses:
+) -> Response:
+    if BaseGameplayApi._impl is None:
         raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseGameplayApi.subclasses[0]().hold_turn(game_id)
+    content = BaseGameplayApi._impl.hold_turn(game_id)
+    return Response(content=content, media_type="application/json")
@@ -5,12 +5,15 @@ Implementation of the Pig Game API endpoints.
 This module contains the actual game logic for the Pig dice game with player matchmaking.
 """
 
-import random
-from typing import Dict
+import os
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, List, Optional, Tuple
 from uuid import UUID, uuid4
 
+import orjson
+from cachetools import TTLCache
 from fastapi import HTTPException
-from pydantic import BaseModel
 
 from openapi_server.apis.game_management_api_base import BaseGameManagementApi
 from openapi_server.apis.gameplay_api_base import BaseGameplayApi
@@ -19,30 +22,116 @@ from openapi_server.models.new_game_response import NewGameResponse
 
 
 # Game metadata to track player count
-class GameMetadata(BaseModel):
+@dataclass(slots=True)
+class GameMetadata:
     """Metadata about a game including its state and player count"""
     state: GameState
     player_count: int  # Number of players who have joined (1 or 2)
+    cached_json: Optional[bytes] = None  # Serialized state; reset on every change
+    version: int = 0  # Incremented on every state change, used for ETags
 
 
-# In-memory storage for games (in production, use a database)
-game_storage: Dict[UUID, GameMetadata] = {}
+# Bounds for in-memory game storage; abandoned games are dropped after the TTL
+GAME_STORAGE_MAX_GAMES = 100_000
+GAME_STORAGE_TTL_SECONDS = 3600
+GAME_STORAGE_SHARDS = 16  # Must be a power of two
+
+# In-memory storage for games (in production, use a database).
+# Keyed by UUID.int so lookups hash a plain int rather than a UUID object, and
+# split into shards by the low bits of that key (random for uuid4).
+# Every state change writes the game back, which restarts its TTL, so only
+# games idle for GAME_STORAGE_TTL_SECONDS expire. TTLCache is not thread-safe;
+# it is only accessed from handlers on the event loop thread, which do not
+# await in between reads and writes.
+game_storage_shards: List["TTLCache[int, GameMetadata]"] = [
+    TTLCache(
+        maxsize=GAME_STORAGE_MAX_GAMES // GAME_STORAGE_SHARDS,
+        ttl=GAME_STORAGE_TTL_SECONDS,
+    )
+    for _ in range(GAME_STORAGE_SHARDS)
+]
+
+
+def _game_storage(key: int) -> "TTLCache[int, GameMetadata]":
+    """Returns the storage shard holding the game with the given key"""
+    return game_storage_shards[key & (GAME_STORAGE_SHARDS - 1)]
+
+
+# Keys of games created with a single player, oldest first, for O(1) matchmaking.
+# Entries are re-checked against game storage when popped.
+waiting_games: Deque[int] = deque()
 
 # Game configuration
 WINNING_SCORE = 100
 
+# Pool of pre-generated die faces, refilled from os.urandom in bulk.
+# Bytes >= 252 are dropped so every face is equally likely (252 = 6 * 42).
+_DIE_POOL: Deque[int] = deque()
+_DIE_POOL_REFILL_BYTES = 4096
+_DIE_FACES = bytes((b % 6) + 1 for b in range(256))
+_DIE_BIASED_BYTES = bytes(range(252, 256))
+
+
+def _refill_die_pool() -> None:
+    """Tops up the die pool with a fresh batch of unbiased faces"""
+    buf = os.urandom(_DIE_POOL_REFILL_BYTES)
+    _DIE_POOL.extend(buf.translate(_DIE_FACES, _DIE_BIASED_BYTES))
+
+
+def _roll_die() -> int:
+    """Returns a die face (1-6) from the pool, refilling it when empty"""
+    try:
+        return _DIE_POOL.popleft()
+    except IndexError:
+        _refill_die_pool()
+        return _DIE_POOL.popleft()
+
+
+def _get_game_metadata(game_id: UUID) -> GameMetadata:
+    """Returns the stored metadata for a game, raising 404 if it does not exist"""
+    key = game_id.int
+    game_metadata = _game_storage(key).get(key)
+    if game_metadata is None:
+        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    return game_metadata
+
+
+def _save_game_metadata(game_id: UUID, game_metadata: GameMetadata) -> None:
+    """Writes a game to storage, restarting its TTL"""
+    key = game_id.int
+    _game_storage(key)[key] = game_metadata
+
+
+def _mark_changed(game_id: UUID, game_metadata: GameMetadata) -> None:
+    """
+    Records a state change: drops the cached JSON, bumps the ETag version and
+    writes the game back to storage. Every mutation path must call this.
+    """
+    game_metadata.cached_json = None
+    game_metadata.version += 1
+    _save_game_metadata(game_id, game_metadata)
+
+
+def _game_state_json(game_metadata: GameMetadata) -> bytes:
+    """Returns the serialized game state, serializing only after a change"""
+    if game_metadata.cached_json is None:
+        game_metadata.cached_json = orjson.dumps(
+            game_metadata.state.model_dump(mode="json")
+        )
+    return game_metadata.cached_json
+
 
 class GameManagementApiImpl(BaseGameManagementApi):
     """
     Implementation of game management operations with player matchmaking.
     """
 
-    async def create_new_game(self) -> NewGameResponse:
+    def create_new_game(self) -> NewGameResponse:
         """
         Creates a new Pig game or joins an existing game waiting for a second player.
         
         Matchmaking logic:
-        1. Look for any existing game with only 1 player
+        1. Take the oldest game still waiting with only 1 player
         2. If found, add this caller as player 1 (index 1)
         3. If not found, create a new game with this caller as player 0 (index 0)
         
@@ -51,34 +140,26 @@ class GameManagementApiImpl(BaseGameManagementApi):
         """
         # Look for a game waiting for a second player
         waiting_game_id = None
-        for game_id, metadata in game_storage.items():
-            if metadata.player_count == 1 and not metadata.state.is_game_over:
-                waiting_game_id = game_id
+        while waiting_games:
+            waiting_key = waiting_games.popleft()
+            metadata = _game_storage(waiting_key).get(waiting_key)
+            if (
+                metadata is not None
+                and metadata.player_count == 1
+                and not metadata.state.is_game_over
+            ):
+                waiting_game_id = metadata.state.game_id
                 break
         
         if waiting_game_id:
             # Join existing game as player 1
-            game_metadata = game_storage[waiting_game_id]
-            old_state = game_metadata.state
-            
-            # Create new state with ready_to_start = True
-            new_state = GameState(
-                game_id=old_state.game_id,
-                current_player_index=old_state.current_player_index,
-                scores=old_state.scores,
-                turn_total=old_state.turn_total,
-                last_roll=old_state.last_roll,
-                ready_to_start=True,  # Now we have 2 players
-                is_game_over=old_state.is_game_over,
-                winner_player_index=old_state.winner_player_index
-            )
-            
-            game_metadata.state = new_state
+            game_metadata = metadata  # Already fetched by the matchmaking loop
+            game_metadata.state.ready_to_start = True  # Now we have 2 players
             game_metadata.player_count = 2
-            game_storage[waiting_game_id] = game_metadata
+            _mark_changed(waiting_game_id, game_metadata)
             
             # Return with player_id = 1
-            return NewGameResponse(
+            return NewGameResponse.model_construct(
                 game_id=waiting_game_id,
                 player_id=1
             )
@@ -91,7 +172,7 @@ class GameManagementApiImpl(BaseGameManagementApi):
             game_state = GameState(
                 game_id=game_id,
                 current_player_index=0,  # Player 0 starts
-                scores=[0, 0],  # Both players start with 0 points
+                scores=(0, 0),  # Both players start with 0 points
                 turn_total=0,  # No points accumulated yet
                 last_roll=None,  # No roll yet
                 ready_to_start=False,  # Waiting for player 1 to join
@@ -104,31 +185,33 @@ class GameManagementApiImpl(BaseGameManagementApi):
                 state=game_state,
                 player_count=1  # Only player 0 has joined so far
             )
-            game_storage[game_id] = game_metadata
+            _save_game_metadata(game_id, game_metadata)
+            waiting_games.append(game_id.int)
             
             # Return with player_id = 0
-            return NewGameResponse(
+            return NewGameResponse.model_construct(
                 game_id=game_id,
                 player_id=0
             )
 
-    async def get_game_state(self, game_id: UUID) -> GameState:
+    def get_game_state_json(self, game_id: UUID) -> Tuple[bytes, int]:
         """
-        Retrieves the current state of a game.
+        Retrieves the current state of a game as serialized JSON.
+        
+        The payload is cached on the game's metadata and reused until the next
+        state change, so repeated polls skip serialization.
         
         Args:
             game_id: The unique identifier of the game
             
         Returns:
-            GameState object with current game information
+            JSON-encoded GameState and the game's state version
             
         Raises:
             HTTPException: 404 if game not found
         """
-        if game_id not in game_storage:
-            raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
-        
-        return game_storage[game_id].state
+        game_metadata = _get_game_metadata(game_id)
+        return _game_state_json(game_metadata), game_metadata.version
 
 
 class GameplayApiImpl(BaseGameplayApi):
@@ -136,7 +219,7 @@ class GameplayApiImpl(BaseGameplayApi):
     Implementation of gameplay operations (roll, hold).
     """
 
-    async def roll_die(self, game_id: UUID) -> GameState:
+    def roll_die(self, game_id: UUID) -> bytes:
         """
         Rolls the die for the current player.
         
@@ -149,65 +232,43 @@ class GameplayApiImpl(BaseGameplayApi):
             game_id: The unique identifier of the game
             
         Returns:
-            Updated GameState after the roll
+            JSON-encoded GameState after the roll, also cached for polls
             
         Raises:
             HTTPException: 404 if game not found, 400 if invalid game state
         """
         # Check if game exists
-        if game_id not in game_storage:
-            raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
-        
-        game_metadata = game_storage[game_id]
-        old_state = game_metadata.state
+        game_metadata = _get_game_metadata(game_id)
+        state = game_metadata.state
         
         # Check if game is ready to start
-        if not old_state.ready_to_start:
+        if not state.ready_to_start:
             raise HTTPException(
                 status_code=400, 
                 detail="Cannot start game. Waiting for second player to join."
             )
         
         # Check if game is already over
-        if old_state.is_game_over:
+        if state.is_game_over:
             raise HTTPException(status_code=400, detail="Game is already over")
         
         # Roll the die (1-6)
-        roll = random.randint(1, 6)
+        roll = _roll_die()
         
-        # Create new state with the roll result
+        # Apply the roll result to the stored state
+        state.last_roll = roll  # Explicitly set the roll value
         if roll == 1:
             # Player rolled a 1 - lose turn total and switch players
-            new_state = GameState(
-                game_id=old_state.game_id,
-                current_player_index=1 - old_state.current_player_index,
-                scores=old_state.scores.copy(),
-                turn_total=0,
-                last_roll=roll,  # Explicitly set the roll value
-                ready_to_start=old_state.ready_to_start,
-                is_game_over=old_state.is_game_over,
-                winner_player_index=old_state.winner_player_index
-            )
+            state.turn_total = 0
+            state.current_player_index ^= 1
         else:
             # Add roll to turn total
-            new_state = GameState(
-                game_id=old_state.game_id,
-                current_player_index=old_state.current_player_index,
-                scores=old_state.scores.copy(),
-                turn_total=old_state.turn_total + roll,
-                last_roll=roll,  # Explicitly set the roll value
-                ready_to_start=old_state.ready_to_start,
-                is_game_over=old_state.is_game_over,
-                winner_player_index=old_state.winner_player_index
-            )
+            state.turn_total += roll
+        _mark_changed(game_id, game_metadata)
         
-        # Update storage with new state
-        game_metadata.state = new_state
-        game_storage[game_id] = game_metadata
-        
-        return new_state
+        return _game_state_json(game_metadata)
 
-    async def hold_turn(self, game_id: UUID) -> GameState:
+    def hold_turn(self, game_id: UUID) -> bytes:
         """
         Current player holds, ending their turn.
         
@@ -221,75 +282,57 @@ class GameplayApiImpl(BaseGameplayApi):
             game_id: The unique identifier of the game
             
         Returns:
-            Updated GameState after holding
+            JSON-encoded GameState after holding, also cached for polls
             
         Raises:
             HTTPException: 404 if game not found, 400 if invalid game state
         """
         # Check if game exists
-        if game_id not in game_storage:
-            raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
-        
-        game_metadata = game_storage[game_id]
-        old_state = game_metadata.state
+        game_metadata = _get_game_metadata(game_id)
+        state = game_metadata.state
         
         # Check if game is ready to start
-        if not old_state.ready_to_start:
+        if not state.ready_to_start:
             raise HTTPException(
                 status_code=400,
                 detail="Cannot start game. Waiting for second player to join."
             )
         
         # Check if game is already over
-        if old_state.is_game_over:
+        if state.is_game_over:
             raise HTTPException(status_code=400, detail="Game is already over")
         
         # Cannot hold if last roll was a 1 (turn already ended)
-        if old_state.last_roll == 1:
+        if state.last_roll == 1:
             raise HTTPException(
                 status_code=400, 
                 detail="Cannot hold after rolling a 1. Turn has already ended."
             )
         
         # Cannot hold if turn_total is 0 (must roll at least once)
-        if old_state.turn_total == 0:
+        if state.turn_total == 0:
             raise HTTPException(
                 status_code=400,
                 detail="Cannot hold with zero points. You must roll at least once."
             )
         
         # Add turn total to current player's score
-        current_player = old_state.current_player_index
-        new_scores = old_state.scores.copy()
-        new_scores[current_player] += old_state.turn_total
+        current_player = state.current_player_index
+        score = state.scores[current_player] + state.turn_total
+        if current_player == 0:
+            state.scores = (score, state.scores[1])
+        else:
+            state.scores = (state.scores[0], score)
+        state.turn_total = 0
+        state.last_roll = None  # Reset for next turn or game over
         
         # Check if current player won
-        if new_scores[current_player] >= WINNING_SCORE:
-            new_state = GameState(
-                game_id=old_state.game_id,
-                current_player_index=current_player,
-                scores=new_scores,
-                turn_total=0,
-                last_roll=None,  # Reset for game over
-                ready_to_start=old_state.ready_to_start,
-                is_game_over=True,
-                winner_player_index=current_player
-            )
+        if score >= WINNING_SCORE:
+            state.is_game_over = True
+            state.winner_player_index = current_player
         else:
             # Switch to next player
-            new_state = GameState(
-                game_id=old_state.game_id,
-                current_player_index=1 - current_player,
-                scores=new_scores,
-                turn_total=0,
-                last_roll=None,  # Reset for next turn
-                ready_to_start=old_state.ready_to_start,
-                is_game_over=old_state.is_game_over,
-                winner_player_index=old_state.winner_player_index
-            )
-        
-        # Update storage with new state (FIXED: store metadata, not just state)
-        game_metadata.state = new_state
-        game_storage[game_id] = game_metadata
+            state.current_player_index = current_player ^ 1
+        _mark_changed(game_id, game_metadata)
         
-        return new_state
+        return _game_state_json(game_metadata)
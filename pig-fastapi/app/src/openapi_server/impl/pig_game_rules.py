@@ -0,0 +1,114 @@
+# coding: utf-8
+
+"""
+Pig game state transitions on a packed integer representation.
+
+The mutable part of a GameState fits in a single 64-bit integer, which lets the
+rules run without touching Pydantic and lets numba compile them when it is
+installed (useful for offline simulation or AI players). Without numba the same
+functions run as plain Python. The API handlers do not use these; they update
+the stored GameState directly, which is cheaper for a single transition;
+tests/test_pig_game_rules.py checks that both play identical games.
+
+Packed layout (least significant bit first):
+    bit  0       current_player_index
+    bits 1-16    scores[0]
+    bits 17-32   scores[1]
+    bits 33-48   turn_total
+    bits 49-51   last_roll (0 means no roll)
+    bit  52      is_game_over
+    bits 53-54   winner_player_index + 1 (0 means no winner)
+"""
+
+from openapi_server.models.game_state import GameState
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+FIELD_MASK = 0xFFFF
+SCORE_SHIFT = 1
+TURN_TOTAL_SHIFT = 33
+LAST_ROLL_SHIFT = 49
+LAST_ROLL_MASK = 0x7
+GAME_OVER_SHIFT = 52
+WINNER_SHIFT = 53
+WINNER_MASK = 0x3
+
+
+def pack_state(state: GameState) -> int:
+    """Packs the mutable fields of a GameState into a single integer"""
+    last_roll = state.last_roll or 0
+    winner = 0 if state.winner_player_index is None else state.winner_player_index + 1
+    return (
+        state.current_player_index
+        | state.scores[0] << SCORE_SHIFT
+        | state.scores[1] << (SCORE_SHIFT + 16)
+        | state.turn_total << TURN_TOTAL_SHIFT
+        | last_roll << LAST_ROLL_SHIFT
+        | int(state.is_game_over) << GAME_OVER_SHIFT
+        | winner << WINNER_SHIFT
+    )
+
+
+def unpack_state(packed: int, state: GameState) -> GameState:
+    """Writes a packed state back onto an existing GameState in place"""
+    last_roll = (packed >> LAST_ROLL_SHIFT) & LAST_ROLL_MASK
+    winner = (packed >> WINNER_SHIFT) & WINNER_MASK
+    state.current_player_index = packed & 1
+    state.scores = (
+        (packed >> SCORE_SHIFT) & FIELD_MASK,
+        (packed >> (SCORE_SHIFT + 16)) & FIELD_MASK,
+    )
+    state.turn_total = (packed >> TURN_TOTAL_SHIFT) & FIELD_MASK
+    state.last_roll = last_roll or None
+    state.is_game_over = bool((packed >> GAME_OVER_SHIFT) & 1)
+    state.winner_player_index = winner - 1 if winner else None
+    return state
+
+
+@njit(cache=True)
+def advance_roll(packed, die):
+    """
+    Applies a die roll to a packed state.
+
+    Rolling a 1 clears the turn total and passes the turn; any other face is
+    added to the turn total. Either way the roll is recorded as last_roll.
+    """
+    bust = int(die == 1)
+    turn_total = (packed >> TURN_TOTAL_SHIFT) & FIELD_MASK
+    turn_total = (turn_total + die) * (bust ^ 1)
+    packed &= ~(
+        (FIELD_MASK << TURN_TOTAL_SHIFT) | (LAST_ROLL_MASK << LAST_ROLL_SHIFT)
+    )
+    packed |= (turn_total << TURN_TOTAL_SHIFT) | (die << LAST_ROLL_SHIFT)
+    return packed ^ bust  # XOR on bit 0 passes the turn only on a bust
+
+
+@njit(cache=True)
+def advance_hold(packed, winning_score):
+    """
+    Banks the turn total for the current player in a packed state.
+
+    The turn total and last roll are cleared. If the new score reaches
+    winning_score the game ends with the current player as winner, otherwise
+    the turn passes to the other player.
+    """
+    player = packed & 1
+    score_shift = SCORE_SHIFT + 16 * player
+    turn_total = (packed >> TURN_TOTAL_SHIFT) & FIELD_MASK
+    score = ((packed >> score_shift) & FIELD_MASK) + turn_total
+    packed &= ~(
+        (FIELD_MASK << score_shift)
+        | (FIELD_MASK << TURN_TOTAL_SHIFT)
+        | (LAST_ROLL_MASK << LAST_ROLL_SHIFT)
+    )
+    packed |= score << score_shift
+    if score >= winning_score:
+        return packed | (1 << GAME_OVER_SHIFT) | ((player + 1) << WINNER_SHIFT)
+    return packed ^ 1  # XOR on bit 0 switches to the other player
@@ -21,7 +21,7 @@ import json
 
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool
-from typing import Any, ClassVar, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 from typing_extensions import Annotated
 from uuid import UUID
 try:
@@ -35,7 +35,7 @@ class GameState(BaseModel):
     """ # noqa: E501
     game_id: UUID = Field(description="Unique identifier for the game.")
     current_player_index: Annotated[int, Field(le=1, strict=True, ge=0)] = Field(description="Index of the player whose turn it is (0 or 1).")
-    scores: Annotated[List[Annotated[int, Field(strict=True, ge=0)]], Field(min_length=2, max_length=2)] = Field(description="Array of current overall scores for each player.")
+    scores: Tuple[Annotated[int, Field(strict=True, ge=0)], Annotated[int, Field(strict=True, ge=0)]] = Field(description="Array of current overall scores for each player.")
     turn_total: Annotated[int, Field(strict=True, ge=0)] = Field(description="Points accumulated in the current players turn.")
     last_roll: Optional[Annotated[int, Field(le=6, strict=True, ge=1)]] = Field(default=None, description="The result of the last die roll. Null if no roll yet this turn.")
     ready_to_start: StrictBool = Field(description="Indicates if both players have joined and the game can be played.")
@@ -45,7 +45,7 @@ class GameState(BaseModel):
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True,
+        "validate_assignment": False,
         "protected_namespaces": (),
     }
 
@@ -30,21 +30,58 @@ def test_create_new_game(client: TestClient):
     #assert response.status_code == 200
 
 
+def _start_game(client: TestClient) -> str:
+    """Returns the id of a game with both players joined"""
+    new_game = client.post("/game").json()
+    if new_game["player_id"] == 0:
+        client.post("/game")  # Join as the second player
+    return new_game["game_id"]
+
+
 def test_get_game_state(client: TestClient):
     """Test case for get_game_state
 
     Get the current state of a specific game.
     """
+    game_id = _start_game(client)
+    url = "/game/{game_id}".format(game_id=game_id)
 
-    headers = {
-    }
-    # uncomment below to make a request
-    #response = client.request(
-    #    "GET",
-    #    "/game/{game_id}".format(game_id='game_id_example'),
-    #    headers=headers,
-    #)
+    response = client.request("GET", url)
+    assert response.status_code == 200
+    assert response.json()["game_id"] == game_id
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
 
-    # uncomment below to assert the status code of the HTTP response
-    #assert response.status_code == 200
+    response = client.request("GET", url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    response = client.request("GET", url, headers={"If-None-Match": "*"})
+    assert response.status_code == 304
+
+    # If-None-Match uses weak comparison, so the strong form of the tag matches
+    strong_etag = etag[len("W/"):]
+    response = client.request(
+        "GET", url, headers={"If-None-Match": '"other", ' + strong_etag}
+    )
+    assert response.status_code == 304
+
+    client.request("POST", "/game/{game_id}/roll".format(game_id=game_id))
+    response = client.request("GET", url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["last_roll"] is not None
 
+
+def test_get_game_state_not_found(client: TestClient):
+    """Test case for get_game_state
+
+    Unknown game ids return 404.
+    """
+    response = client.request(
+        "GET",
+        "/game/{game_id}".format(game_id="00000000-0000-4000-8000-000000000000"),
+        headers={"If-None-Match": "*"},
+    )
+    assert response.status_code == 404
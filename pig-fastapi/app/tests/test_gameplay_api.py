@@ -1,49 +1,149 @@
 # coding: utf-8
 
+from collections import deque
+
+import pytest
 from fastapi.testclient import TestClient
 
 
 from pydantic import Field  # noqa: F401
 from typing_extensions import Annotated  # noqa: F401
 from uuid import UUID  # noqa: F401
+from openapi_server.impl import pig_game_impl
 from openapi_server.models.error_response import ErrorResponse  # noqa: F401
 from openapi_server.models.game_state import GameState  # noqa: F401
 
 
-def test_roll_die(client: TestClient):
+@pytest.fixture(autouse=True)
+def fresh_matchmaking(monkeypatch):
+    """Keeps games left waiting by other tests out of matchmaking"""
+    monkeypatch.setattr(pig_game_impl, "waiting_games", deque())
+
+
+def _load_dice(monkeypatch, *faces: int) -> None:
+    """Makes the next rolls return the given faces, in order"""
+    monkeypatch.setattr(pig_game_impl, "_DIE_POOL", deque(faces))
+
+
+def _start_game(client: TestClient) -> str:
+    """Returns the id of a new game with both players joined"""
+    game_id = client.post("/game").json()["game_id"]
+    assert client.post("/game").json() == {"game_id": game_id, "player_id": 1}
+    return game_id
+
+
+def _roll(client: TestClient, game_id: str):
+    return client.request("POST", "/game/{game_id}/roll".format(game_id=game_id))
+
+
+def _hold(client: TestClient, game_id: str):
+    return client.request("POST", "/game/{game_id}/hold".format(game_id=game_id))
+
+
+def test_roll_die(client: TestClient, monkeypatch):
     """Test case for roll_die
 
     Roll the die for the current player.
     """
+    game_id = _start_game(client)
+    _load_dice(monkeypatch, 4, 3, 1)
+
+    response = _roll(client, game_id)
+    assert response.status_code == 200
+    state = response.json()
+    assert state["current_player_index"] == 0
+    assert state["turn_total"] == 4
+    assert state["last_roll"] == 4
 
-    headers = {
-    }
-    # uncomment below to make a request
-    #response = client.request(
-    #    "POST",
-    #    "/game/{game_id}/roll".format(game_id='game_id_example'),
-    #    headers=headers,
-    #)
+    state = _roll(client, game_id).json()
+    assert state["current_player_index"] == 0
+    assert state["turn_total"] == 7
+    assert state["last_roll"] == 3
 
-    # uncomment below to assert the status code of the HTTP response
-    #assert response.status_code == 200
+    # Rolling a 1 clears the turn total and passes the turn
+    state = _roll(client, game_id).json()
+    assert state["current_player_index"] == 1
+    assert state["turn_total"] == 0
+    assert state["last_roll"] == 1
+    assert state["scores"] == [0, 0]
+    assert state == client.get("/game/{game_id}".format(game_id=game_id)).json()
 
 
-def test_hold_turn(client: TestClient):
+def test_roll_die_before_second_player(client: TestClient):
+    """Test case for roll_die
+
+    Rolling is rejected until both players have joined.
+    """
+    game_id = client.post("/game").json()["game_id"]
+
+    response = _roll(client, game_id)
+    assert response.status_code == 400
+    assert _hold(client, game_id).status_code == 400
+
+
+def test_hold_turn(client: TestClient, monkeypatch):
     """Test case for hold_turn
 
     Current player holds, ending their turn and adding turn total to score.
     """
+    game_id = _start_game(client)
+    _load_dice(monkeypatch, 5, 6, 2, 4)
+
+    # Player 0 banks 11 into their own slot
+    _roll(client, game_id)
+    _roll(client, game_id)
+    response = _hold(client, game_id)
+    assert response.status_code == 200
+    state = response.json()
+    assert state["scores"] == [11, 0]
+    assert state["current_player_index"] == 1
+    assert state["turn_total"] == 0
+    assert state["last_roll"] is None
+    assert not state["is_game_over"]
+
+    # Player 1 banks 6 into the second slot
+    _roll(client, game_id)
+    _roll(client, game_id)
+    state = _hold(client, game_id).json()
+    assert state["scores"] == [11, 6]
+    assert state["current_player_index"] == 0
+    assert state["winner_player_index"] is None
 
-    headers = {
-    }
-    # uncomment below to make a request
-    #response = client.request(
-    #    "POST",
-    #    "/game/{game_id}/hold".format(game_id='game_id_example'),
-    #    headers=headers,
-    #)
 
-    # uncomment below to assert the status code of the HTTP response
-    #assert response.status_code == 200
+def test_hold_turn_winning(client: TestClient, monkeypatch):
+    """Test case for hold_turn
+
+    Reaching the winning score ends the game; no further moves are allowed.
+    """
+    game_id = _start_game(client)
+    pig_game_impl._get_game_metadata(UUID(game_id)).state.scores = (0, 96)
+    _load_dice(monkeypatch, 1, 4)
+
+    _roll(client, game_id)  # Player 0 busts, passing the turn to player 1
+    _roll(client, game_id)
+    state = _hold(client, game_id).json()
+    assert state["scores"] == [0, 100]
+    assert state["is_game_over"]
+    assert state["winner_player_index"] == 1
+    assert state["current_player_index"] == 1
+
+    assert _roll(client, game_id).status_code == 400
+    assert _hold(client, game_id).status_code == 400
+
+
+def test_hold_turn_rejected(client: TestClient, monkeypatch):
+    """Test case for hold_turn
+
+    Holding needs points this turn and is not allowed right after a 1.
+    """
+    game_id = _start_game(client)
+    _load_dice(monkeypatch, 1)
+
+    response = _hold(client, game_id)
+    assert response.status_code == 400
+    assert "zero points" in response.json()["detail"]
 
+    _roll(client, game_id)
+    response = _hold(client, game_id)
+    assert response.status_code == 400
+    assert "rolling a 1" in response.json()["detail"]
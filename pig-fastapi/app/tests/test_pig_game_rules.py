@@ -0,0 +1,141 @@
+# coding: utf-8
+
+import random
+from collections import deque
+from uuid import uuid4
+
+from openapi_server.impl import pig_game_impl
+from openapi_server.impl.pig_game_rules import (
+    advance_hold,
+    advance_roll,
+    pack_state,
+    unpack_state,
+)
+from openapi_server.models.game_state import GameState
+
+
+def _state(**overrides) -> GameState:
+    fields = dict(
+        game_id=uuid4(),
+        current_player_index=0,
+        scores=(0, 0),
+        turn_total=0,
+        last_roll=None,
+        ready_to_start=True,
+        is_game_over=False,
+        winner_player_index=None,
+    )
+    fields.update(overrides)
+    return GameState(**fields)
+
+
+def _advance(state: GameState, packed: int) -> GameState:
+    return unpack_state(packed, state.model_copy())
+
+
+def test_pack_unpack_round_trip():
+    """Test case for pack_state/unpack_state
+
+    Every packed field survives a round trip, including the nullable ones.
+    """
+    for state in (
+        _state(),
+        _state(current_player_index=1, scores=(42, 97), turn_total=15, last_roll=5),
+        _state(scores=(103, 12), is_game_over=True, winner_player_index=0),
+        _state(current_player_index=1, scores=(8, 120), is_game_over=True,
+               winner_player_index=1),
+    ):
+        restored = _advance(_state(), pack_state(state))
+        assert restored.model_dump(exclude={"game_id"}) == state.model_dump(
+            exclude={"game_id"}
+        )
+
+
+def test_advance_roll_bust():
+    """Test case for advance_roll
+
+    Rolling a 1 clears the turn total and passes the turn.
+    """
+    state = _state(scores=(10, 20), turn_total=9, last_roll=4)
+    result = _advance(state, advance_roll(pack_state(state), 1))
+
+    assert result.current_player_index == 1
+    assert result.scores == (10, 20)
+    assert result.turn_total == 0
+    assert result.last_roll == 1
+    assert not result.is_game_over
+
+
+def test_advance_roll_adds_to_turn_total():
+    """Test case for advance_roll
+
+    Rolling 2-6 adds to the turn total and keeps the turn.
+    """
+    state = _state(current_player_index=1, scores=(10, 20), turn_total=9, last_roll=4)
+    result = _advance(state, advance_roll(pack_state(state), 6))
+
+    assert result.current_player_index == 1
+    assert result.scores == (10, 20)
+    assert result.turn_total == 15
+    assert result.last_roll == 6
+
+
+def test_advance_hold_switches_player():
+    """Test case for advance_hold
+
+    Holding banks the turn total and passes the turn.
+    """
+    state = _state(current_player_index=1, scores=(10, 20), turn_total=9, last_roll=4)
+    result = _advance(state, advance_hold(pack_state(state), 100))
+
+    assert result.current_player_index == 0
+    assert result.scores == (10, 29)
+    assert result.turn_total == 0
+    assert result.last_roll is None
+    assert not result.is_game_over
+    assert result.winner_player_index is None
+
+
+def test_advance_hold_winning():
+    """Test case for advance_hold
+
+    Reaching the winning score ends the game with the current player as winner.
+    """
+    state = _state(scores=(95, 20), turn_total=7, last_roll=3)
+    result = _advance(state, advance_hold(pack_state(state), 100))
+
+    assert result.current_player_index == 0
+    assert result.scores == (102, 20)
+    assert result.turn_total == 0
+    assert result.last_roll is None
+    assert result.is_game_over
+    assert result.winner_player_index == 0
+
+
+def test_kernels_match_server_handlers(monkeypatch):
+    """Test case for advance_roll/advance_hold
+
+    The kernels and the handlers the server runs play identical games from the
+    same dice, so the two copies of the rules cannot drift apart.
+    """
+    rng = random.Random(1234)
+    monkeypatch.setattr(pig_game_impl, "waiting_games", deque())
+    management = pig_game_impl.GameManagementApiImpl()
+    gameplay = pig_game_impl.GameplayApiImpl()
+
+    for _ in range(20):
+        game_id = management.create_new_game().game_id
+        management.create_new_game()
+        state = pig_game_impl._get_game_metadata(game_id).state
+        packed = pack_state(state)
+
+        while not state.is_game_over:
+            if state.turn_total >= rng.randint(10, 25) and state.last_roll != 1:
+                gameplay.hold_turn(game_id)
+                packed = advance_hold(packed, pig_game_impl.WINNING_SCORE)
+            else:
+                die = rng.randint(1, 6)
+                monkeypatch.setattr(pig_game_impl, "_DIE_POOL", deque([die]))
+                gameplay.roll_die(game_id)
+                packed = advance_roll(packed, die)
+            assert pack_state(state) == packed